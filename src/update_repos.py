@@ -3,10 +3,10 @@
 Git Repository Updater - Main entry point.
 
 This script reads repository configurations from a CSV file and updates
-each repository by fetching and pulling the specified branches.
+each repository by fetching and fast-forwarding the specified branches.
 
 Usage:
-    python update_repos.py [--csv PATH] [--no-color] [--dry-run]
+    python update_repos.py [--csv PATH] [--jobs N] [--no-color] [--dry-run]
 
 Examples:
     python update_repos.py                    # Use default repos.csv
@@ -17,7 +17,9 @@ Examples:
 import argparse
 import os
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Iterable
 
 # Resolve symlinks to get the real script location, then find project root
 # This works both for direct execution and when symlinked from /usr/bin
@@ -31,6 +33,9 @@ from util.logger import Logger
 from util.csv_handler import get_enabled_repositories
 from util.git_operations import GitRepo
 
+# Updates are dominated by network-bound git fetches, so oversubscribe the CPUs
+DEFAULT_JOBS = min(32, (os.cpu_count() or 1) * 4)
+
 
 def get_original_user() -> str | None:
     """
@@ -67,6 +72,7 @@ Examples:
     %(prog)s                          # Use default repos.csv
     %(prog)s --csv ~/my_repos.csv     # Custom CSV file
     %(prog)s --dry-run                # Preview without updating
+    %(prog)s --jobs 1                 # Update repositories one at a time
         """
     )
 
@@ -77,10 +83,17 @@ Examples:
         help="Path to the CSV configuration file (default: repos.csv in project root)"
     )
 
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Number of repositories to update in parallel (default: {DEFAULT_JOBS})"
+    )
+
     parser.add_argument(
         "--no-color",
         action="store_true",
-        help="Disable colored output"
+        help="Disable colored output (automatic when stdout is not a terminal)"
     )
 
     parser.add_argument(
@@ -142,6 +155,9 @@ def update_repository(repo: Repository, dry_run: bool = False, run_as_user: str
     """
     Update a single repository.
 
+    Log output is buffered and written in one piece when the repository is
+    done, so repositories updated in parallel do not interleave.
+
     Args:
         repo: Repository configuration
         dry_run: If True, only preview without making changes
@@ -150,6 +166,16 @@ def update_repository(repo: Repository, dry_run: bool = False, run_as_user: str
     Returns:
         List of UpdateResult for each branch
     """
+    Logger.begin_buffer()
+    try:
+        return _update_branches(repo, dry_run, run_as_user)
+    finally:
+        Logger.newline()
+        Logger.flush_buffer()
+
+
+def _update_branches(repo: Repository, dry_run: bool, run_as_user: str | None) -> list[UpdateResult]:
+    """Fetch and update the configured branches of a repository (see update_repository)."""
     results = []
 
     Logger.info(f"Processing: {repo.path}")
@@ -163,8 +189,8 @@ def update_repository(repo: Repository, dry_run: bool = False, run_as_user: str
         return results
 
     with GitRepo(repo.path, run_as_user=run_as_user) as git:
-        # Check for uncommitted changes
-        if git.has_uncommitted_changes():
+        # Check for uncommitted changes (read once when entering the context)
+        if git.uncommitted_changes:
             Logger.warning(f"  Repository has uncommitted changes, skipping")
             for branch in repo.branches:
                 results.append(UpdateResult.failure_result(
@@ -172,19 +198,35 @@ def update_repository(repo: Repository, dry_run: bool = False, run_as_user: str
                 ))
             return results
 
-        # Fetch all remotes first
-        Logger.dim(f"  Fetching remotes...")
-        if not git.fetch_all():
-            for branch in repo.branches:
+        # Branches whose local ref already matches the remote need no fetch or update
+        up_to_date = git.up_to_date_branches(repo.branches)
+        pending = [branch for branch in repo.branches if branch not in up_to_date]
+
+        # Fetch all remotes first, unless every branch is already current
+        if pending:
+            Logger.dim(f"  Fetching remotes...")
+            fetched = git.fetch_all()
+        else:
+            fetched = True
+
+        # Update each branch; the checked-out one is merged with --ff-only,
+        # the others are fast-forwarded from the fetched refs in place
+        for branch in repo.branches:
+            if branch in up_to_date:
+                Logger.success(f"    {branch}: Already up to date")
+                results.append(UpdateResult.success_result(
+                    repo.path, branch, "Already up to date"
+                ))
+                continue
+
+            if not fetched:
                 results.append(UpdateResult.failure_result(
                     repo.path, branch, "Failed to fetch remotes"
                 ))
-            return results
+                continue
 
-        # Update each branch
-        for branch in repo.branches:
             Logger.dim(f"  Updating branch: {branch}")
-            result = git.update_branch(branch)
+            result = git.update_branch_fast_forward(branch)
             results.append(result)
 
             if result.success:
@@ -195,13 +237,40 @@ def update_repository(repo: Repository, dry_run: bool = False, run_as_user: str
     return results
 
 
+def merge_duplicate_repositories(repos: Iterable[Repository]) -> list[Repository]:
+    """
+    Merge rows that point at the same repository into one entry.
+
+    Rows for the same working tree must not be updated in parallel, since
+    their checkouts and merges would race on one HEAD. Their branches are
+    combined (in CSV order, without duplicates) so each repository is handled
+    by a single job.
+
+    Args:
+        repos: Enabled repositories in CSV order
+
+    Returns:
+        One Repository per distinct resolved path, in order of first appearance
+    """
+    merged: dict[Path, Repository] = {}
+    for repo in repos:
+        key = repo.path.resolve()
+        if key not in merged:
+            merged[key] = Repository(path=repo.path, branches=list(repo.branches), enabled=repo.enabled)
+            continue
+
+        branches = merged[key].branches
+        branches.extend(branch for branch in repo.branches if branch not in branches)
+
+    return list(merged.values())
+
+
 def main() -> int:
     """Main entry point for the repository updater."""
     args = parse_args()
 
-    # Configure logger
-    if args.no_color:
-        Logger.use_colors = False
+    # Configure logger; colors would pollute redirected output
+    Logger.set_colors(not args.no_color and sys.stdout.isatty())
 
     # Print header
     Logger.header("Git Repository Updater")
@@ -225,23 +294,35 @@ def main() -> int:
     Logger.info(f"Loading repositories from: {args.csv}")
     Logger.newline()
 
-    # Process repositories
-    all_results: list[UpdateResult] = []
-    repo_count = 0
+    # Process repositories in parallel, keeping results in CSV order
+    executor = ThreadPoolExecutor(max_workers=max(1, args.jobs))
+    futures: dict[Future[list[UpdateResult]], int] = {}
+    results_by_index: dict[int, list[UpdateResult]] = {}
 
     try:
-        for repo in get_enabled_repositories(args.csv):
-            repo_count += 1
-            results = update_repository(repo, dry_run=args.dry_run, run_as_user=run_as_user)
-            all_results.extend(results)
-            Logger.newline()
+        repos = merge_duplicate_repositories(get_enabled_repositories(args.csv))
+        for index, repo in enumerate(repos):
+            future = executor.submit(update_repository, repo, args.dry_run, run_as_user)
+            futures[future] = index
+
+        for future in as_completed(futures):
+            results_by_index[futures[future]] = future.result()
     except FileNotFoundError as e:
+        executor.shutdown(wait=False, cancel_futures=True)
         Logger.error(str(e))
         return 1
     except KeyboardInterrupt:
+        executor.shutdown(wait=False, cancel_futures=True)
         Logger.warning("\nInterrupted by user")
         return 130
 
+    executor.shutdown()
+
+    repo_count = len(futures)
+    all_results: list[UpdateResult] = []
+    for index in sorted(results_by_index):
+        all_results.extend(results_by_index[index])
+
     if repo_count == 0:
         Logger.warning("No enabled repositories found in CSV file")
         return 0
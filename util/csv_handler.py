@@ -6,6 +6,8 @@ from CSV files using a generator pattern for memory efficiency.
 """
 
 import csv
+import os
+from collections import Counter
 from pathlib import Path
 from typing import Generator
 
@@ -41,34 +43,66 @@ def load_repositories(csv_path: Path) -> Generator[Repository, None, None]:
         raise ValueError(f"Path is not a file: {csv_path}")
 
     with open(csv_path, "r", newline="", encoding="utf-8") as file:
-        reader = csv.DictReader(file)
+        reader = csv.reader(file)
 
         # Validate headers
-        if reader.fieldnames is None:
+        header = next(reader, None)
+        if not header:
             Logger.error("CSV file is empty or has no headers")
             return
 
+        header = [name.strip() for name in header]
         required_fields = {"path", "branches"}
-        missing_fields = required_fields - set(reader.fieldnames)
+        missing_fields = required_fields - set(header)
         if missing_fields:
             Logger.error(f"CSV missing required columns: {', '.join(missing_fields)}")
             return
 
+        # Resolve column positions once instead of building a dict per row
+        idx_path = header.index("path")
+        idx_branches = header.index("branches")
+        idx_enabled = header.index("enabled") if "enabled" in header else -1
+
         for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is row 1)
+            if not row:
+                continue  # Blank line
             try:
-                repo = Repository.from_csv_row(row)
+                repo = Repository.from_row(row, idx_path, idx_branches, idx_enabled)
                 yield repo
             except ValueError as e:
                 Logger.warning(f"Row {row_num}: {e}")
                 continue
 
 
+def _scan_parents(parents: set[Path]) -> dict[Path, dict[str, os.DirEntry]]:
+    """
+    List each parent directory once with os.scandir.
+
+    Args:
+        parents: Directories containing the repositories
+
+    Returns:
+        Mapping of parent directory to its entries by name. Parents that cannot
+        be listed are left out, so their repositories fall back to stat.
+    """
+    scanned = {}
+    for parent in parents:
+        try:
+            with os.scandir(parent) as entries:
+                scanned[parent] = {entry.name: entry for entry in entries}
+        except OSError:
+            continue
+    return scanned
+
+
 def get_enabled_repositories(csv_path: Path) -> Generator[Repository, None, None]:
     """
     Load only enabled repositories from a CSV file.
 
     Convenience wrapper around load_repositories that filters out
-    disabled repositories and validates each one.
+    disabled repositories and validates each one. Parent directories shared
+    by several repositories are listed once with os.scandir, rather than
+    stat'ing every repository path separately.
 
     Args:
         csv_path: Path to the CSV configuration file
@@ -76,37 +110,23 @@ def get_enabled_repositories(csv_path: Path) -> Generator[Repository, None, None
     Yields:
         Valid, enabled Repository objects
     """
-    for repo in load_repositories(csv_path):
+    repos = list(load_repositories(csv_path))
+
+    # Only worth a directory listing when it answers for more than one repo
+    parent_counts = Counter(repo.path.parent for repo in repos if repo.enabled)
+    scanned = _scan_parents({parent for parent, count in parent_counts.items() if count > 1})
+
+    for repo in repos:
         if not repo.enabled:
             Logger.dim(f"  Skipping disabled repository: {repo.path}")
             continue
 
         # Validate the repository
-        errors = repo.validate()
+        entry = scanned.get(repo.path.parent, {}).get(repo.path.name)
+        errors = repo.validate(entry)
         if errors:
             for error in errors:
                 Logger.warning(error)
             continue
 
         yield repo
-
-
-def count_repositories(csv_path: Path) -> tuple[int, int]:
-    """
-    Count total and enabled repositories in a CSV file.
-
-    Args:
-        csv_path: Path to the CSV configuration file
-
-    Returns:
-        Tuple of (total_count, enabled_count)
-    """
-    total = 0
-    enabled = 0
-
-    for repo in load_repositories(csv_path):
-        total += 1
-        if repo.enabled and not repo.validate():
-            enabled += 1
-
-    return total, enabled
@@ -6,13 +6,17 @@ with a context manager pattern to ensure the original branch is restored after
 operations complete.
 """
 
+import os
 import subprocess
 from pathlib import Path
-from typing import Self
+from typing import Literal, Self
 
 from .logger import Logger
 from .models import UpdateResult
 
+# Parallel children for fetching several remotes (and submodules) at once
+FETCH_JOBS = os.cpu_count() or 4
+
 
 class GitError(Exception):
     """Exception raised when a git command fails."""
@@ -23,20 +27,21 @@ class GitRepo:
     """
     Context manager for git repository operations.
 
-    Provides methods for common git operations (fetch, checkout, pull) with
-    automatic restoration of the original branch when exiting the context.
+    Provides methods for common git operations (fetch, checkout, fast-forward)
+    with automatic restoration of the original branch when exiting the context.
 
     Example:
         with GitRepo(Path("/path/to/repo")) as repo:
             repo.fetch_all()
             for branch in ["main", "develop"]:
-                if repo.checkout(branch):
-                    repo.pull()
+                repo.update_branch_fast_forward(branch)
         # Original branch is automatically restored
 
     Attributes:
         path: Path to the git repository
         original_branch: Branch that was active when context was entered
+        current_branch: Branch currently checked out, tracked to skip no-op checkouts
+        uncommitted_changes: Whether the worktree was dirty when context was entered
     """
 
     def __init__(self, path: Path, run_as_user: str | None = None) -> None:
@@ -49,40 +54,122 @@ class GitRepo:
         """
         self.path = path
         self.original_branch: str | None = None
+        self.current_branch: str | None = None
+        self.uncommitted_changes = False
         self._entered = False
         self.run_as_user = run_as_user
+        self._catfile: subprocess.Popen | None = None
+        self._upstreams: dict[str, tuple[str, str, str] | None] = {}
 
     def __enter__(self) -> Self:
         """
-        Enter the context and save the current branch.
+        Enter the context and save the current branch and worktree state.
 
         Returns:
             Self for use in with statements
         """
         self._entered = True
-        self.original_branch = self.get_current_branch()
+        self.original_branch, self.uncommitted_changes = self.prepare()
+        self.current_branch = self.original_branch
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """
         Exit the context and restore the original branch.
 
-        Attempts to restore the original branch if it was saved.
-        Logs a warning if restoration fails.
+        Attempts to restore the original branch if it was saved and another
+        branch has since been checked out. Logs a warning if restoration fails.
+        Also stops the ref lookup process, if one was started.
         """
-        if self.original_branch:
+        self._close_catfile()
+
+        if self.original_branch and self.current_branch != self.original_branch:
             try:
-                self._run_git("checkout", self.original_branch)
+                self._run_git("checkout", self.original_branch, capture="err_only")
             except GitError:
                 Logger.warning(f"Could not restore original branch: {self.original_branch}")
 
-    def _run_git(self, *args: str, capture_output: bool = True) -> subprocess.CompletedProcess:
+    def _git_command(self, *args: str) -> list[str]:
+        """Build the command line for a git command, wrapped in sudo -u if needed."""
+        git_cmd = ["git", "-C", str(self.path)] + list(args)
+
+        # If run_as_user is specified, wrap with sudo -u
+        if self.run_as_user:
+            return ["sudo", "-u", self.run_as_user] + git_cmd
+        return git_cmd
+
+    def _close_catfile(self) -> None:
+        """Stop the long-lived cat-file process used by lookup()."""
+        if self._catfile is None:
+            return
+
+        catfile, self._catfile = self._catfile, None
+        try:
+            catfile.stdin.close()  # cat-file exits at end of input
+            catfile.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            catfile.kill()
+            catfile.wait()
+
+    def lookup(self, ref: str) -> str | None:
+        """
+        Resolve a ref to an object SHA.
+
+        Lookups are answered by a single ``git cat-file --batch-check`` process
+        that is started on first use and kept open until the context exits, so
+        repeated lookups do not each fork a git process.
+
+        Args:
+            ref: Ref or revision to resolve (e.g. "refs/heads/main")
+
+        Returns:
+            Object SHA, or None if the ref does not exist
+
+        Raises:
+            GitError: If the cat-file process cannot be started or dies
+        """
+        if self._catfile is None:
+            try:
+                self._catfile = subprocess.Popen(
+                    self._git_command("cat-file", "--batch-check"),
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True
+                )
+            except FileNotFoundError:
+                raise GitError("Git is not installed or not in PATH")
+
+        try:
+            self._catfile.stdin.write(ref + "\n")
+            self._catfile.stdin.flush()
+            line = self._catfile.stdout.readline()
+        except OSError as e:
+            self._close_catfile()
+            raise GitError(f"Git cat-file failed: {e}")
+
+        if not line:
+            self._close_catfile()
+            raise GitError("Git cat-file exited unexpectedly")
+
+        # "<sha> <type> <size>", or "<ref> missing" / "<ref> ambiguous"; check
+        # the suffix since a ref containing spaces splits into several fields
+        line = line.rstrip("\n")
+        if line.endswith((" missing", " ambiguous")):
+            return None
+        return line.split(" ", 1)[0]
+
+    def _run_git(
+        self, *args: str, capture: Literal["full", "err_only", "none"] = "full"
+    ) -> subprocess.CompletedProcess:
         """
         Run a git command in the repository directory.
 
         Args:
             *args: Git command and arguments (e.g., "fetch", "--all")
-            capture_output: Whether to capture stdout/stderr
+            capture: Which output to capture: "full" for stdout and stderr,
+                "err_only" to discard stdout and keep stderr for error messages,
+                or "none" to discard both
 
         Returns:
             CompletedProcess instance with command results
@@ -90,24 +177,23 @@ class GitRepo:
         Raises:
             GitError: If the git command fails
         """
-        git_cmd = ["git", "-C", str(self.path)] + list(args)
-        
-        # If run_as_user is specified, wrap with sudo -u
-        if self.run_as_user:
-            cmd = ["sudo", "-u", self.run_as_user] + git_cmd
-        else:
-            cmd = git_cmd
+        cmd = self._git_command(*args)
+
+        # Send unused output to /dev/null rather than piping it into Python
+        stdout = subprocess.PIPE if capture == "full" else subprocess.DEVNULL
+        stderr = subprocess.DEVNULL if capture == "none" else subprocess.PIPE
 
         try:
             result = subprocess.run(
                 cmd,
-                capture_output=capture_output,
+                stdout=stdout,
+                stderr=stderr,
                 text=True,
                 timeout=120  # 2 minute timeout for slow operations
             )
 
             if result.returncode != 0:
-                error_msg = result.stderr.strip() or result.stdout.strip() or "Unknown error"
+                error_msg = (result.stderr or "").strip() or (result.stdout or "").strip() or "Unknown error"
                 raise GitError(f"Git command failed: {' '.join(args)}\n{error_msg}")
 
             return result
@@ -117,28 +203,62 @@ class GitRepo:
         except FileNotFoundError:
             raise GitError("Git is not installed or not in PATH")
 
-    def get_current_branch(self) -> str:
+    def prepare(self) -> tuple[str, bool]:
         """
-        Get the name of the current branch.
+        Get the current branch and uncommitted-changes state in one git call.
+
+        Uses ``status --porcelain=v2 --branch``, whose header reports the
+        branch, instead of separate rev-parse and status processes. Ahead/behind
+        counts are not needed, so their commit walk is skipped.
+
+        If core.untrackedCache is not configured, it is enabled for this call
+        only; git then stores the untracked cache in the index, so repeated runs
+        can skip rescanning unchanged directories. An explicit setting in the
+        user's config, including false, is left in effect.
 
         Returns:
-            Current branch name
+            Tuple of (current branch name, has uncommitted changes). The branch
+            is "HEAD" when detached
 
         Raises:
-            GitError: If unable to determine current branch
+            GitError: If the status command fails
         """
-        result = self._run_git("rev-parse", "--abbrev-ref", "HEAD")
-        return result.stdout.strip()
+        try:
+            self._run_git("config", "--get", "core.untrackedCache")
+            cache_args: tuple[str, ...] = ()
+        except GitError:
+            # Not set (config --get exits non-zero)
+            cache_args = ("-c", "core.untrackedCache=true")
+
+        result = self._run_git(
+            *cache_args, "status", "--porcelain=v2", "--branch", "--no-ahead-behind"
+        )
+
+        branch = "HEAD"
+        dirty = False
+        for line in result.stdout.splitlines():
+            if line.startswith("# branch.head "):
+                head = line.removeprefix("# branch.head ")
+                if head != "(detached)":
+                    branch = head
+            elif line and not line.startswith("#"):
+                dirty = True
+
+        return branch, dirty
 
     def fetch_all(self) -> bool:
         """
         Fetch all remotes.
 
+        Remotes and submodules are fetched in parallel. ``--jobs`` is passed on
+        the command line rather than via GIT_CONFIG_* variables, since sudo
+        would strip those from the environment when running as another user.
+
         Returns:
             True if fetch succeeded, False otherwise
         """
         try:
-            self._run_git("fetch", "--all", "--prune")
+            self._run_git("fetch", "--all", "--prune", f"--jobs={FETCH_JOBS}", capture="err_only")
             return True
         except GitError as e:
             Logger.error(f"Fetch failed: {e}")
@@ -148,52 +268,170 @@ class GitRepo:
         """
         Checkout the specified branch.
 
+        Does nothing if the branch is already checked out.
+
         Args:
             branch: Name of the branch to checkout
 
         Returns:
             True if checkout succeeded, False otherwise
         """
+        if branch == self.current_branch:
+            return True
+
         try:
-            self._run_git("checkout", branch)
+            self._run_git("checkout", branch, capture="err_only")
+            self.current_branch = branch
             return True
         except GitError as e:
             Logger.error(f"Checkout failed for branch '{branch}': {e}")
             return False
 
-    def pull(self) -> bool:
+    def get_upstreams(self, branches: list[str]) -> dict[str, tuple[str, str, str] | None]:
         """
-        Pull latest changes from remote.
+        Get the upstreams of several local branches with one for-each-ref call.
+
+        Results are cached on the instance, since upstream configuration does
+        not change while updating.
+
+        Args:
+            branches: Names of the local branches
 
         Returns:
-            True if pull succeeded, False otherwise
+            Mapping of branch name to (remote-tracking ref, remote name, ref on
+            the remote), e.g. ("refs/remotes/origin/main", "origin",
+            "refs/heads/main"), or None if the branch does not exist locally
+            or has no upstream
         """
-        try:
-            self._run_git("pull", "--ff-only")
-            return True
-        except GitError as e:
-            Logger.error(f"Pull failed: {e}")
-            return False
+        missing = [branch for branch in branches if branch not in self._upstreams]
+        if missing:
+            self._upstreams.update(dict.fromkeys(missing))
+            try:
+                result = self._run_git(
+                    "for-each-ref",
+                    "--format=%(refname) %(upstream) %(upstream:remotename) %(upstream:remoteref)",
+                    *(f"refs/heads/{branch}" for branch in missing)
+                )
+            except GitError:
+                result = None
+
+            # Ref and remote names cannot contain spaces
+            for line in result.stdout.splitlines() if result else []:
+                refname, tracking_ref, remote, remote_ref = line.split(" ")
+                if tracking_ref and remote and remote_ref:
+                    branch = refname.removeprefix("refs/heads/")
+                    self._upstreams[branch] = (tracking_ref, remote, remote_ref)
 
-    def has_uncommitted_changes(self) -> bool:
+        return {branch: self._upstreams[branch] for branch in branches}
+
+    def get_upstream(self, branch: str) -> str | None:
         """
-        Check if there are uncommitted changes in the repository.
+        Get the remote-tracking ref a local branch is configured to follow.
+
+        Args:
+            branch: Name of the local branch
 
         Returns:
-            True if there are uncommitted changes
+            Full upstream ref (e.g. "refs/remotes/origin/main"), or None if the
+            branch does not exist locally or has no upstream
+        """
+        upstream = self.get_upstreams([branch])[branch]
+        return upstream[0] if upstream else None
+
+    def remote_shas(self, branches: list[str]) -> dict[str, str]:
+        """
+        Ask the remotes for the current SHAs of several branches' upstreams.
+
+        Runs one ``ls-remote`` per remote, which only transfers ref metadata,
+        no objects.
+
+        Args:
+            branches: Names of the local branches
+
+        Returns:
+            Mapping of branch name to the SHA of its upstream on the remote.
+            Branches with no upstream, or whose remote could not be queried,
+            are left out
+        """
+        # Group the requested remote refs by remote
+        by_remote: dict[str, dict[str, list[str]]] = {}
+        for branch, upstream in self.get_upstreams(branches).items():
+            if upstream:
+                _, remote, remote_ref = upstream
+                by_remote.setdefault(remote, {}).setdefault(remote_ref, []).append(branch)
+
+        shas = {}
+        for remote, refs in by_remote.items():
+            try:
+                result = self._run_git("ls-remote", remote, *refs)
+            except GitError:
+                continue
+
+            # Patterns match ref name tails, so keep exact matches only
+            for line in result.stdout.splitlines():
+                sha, _, ref = line.partition("\t")
+                for branch in refs.get(ref, []):
+                    shas[branch] = sha
+        return shas
+
+    def local_sha(self, branch: str) -> str | None:
+        """
+        Get the SHA a local branch points to.
+
+        Args:
+            branch: Name of the local branch
+
+        Returns:
+            Commit SHA, or None if the branch does not exist locally
         """
         try:
-            result = self._run_git("status", "--porcelain")
-            return bool(result.stdout.strip())
+            return self.lookup(f"refs/heads/{branch}")
         except GitError:
-            return True  # Assume changes if we can't check
+            return None
+
+    def up_to_date_branches(self, branches: list[str]) -> set[str]:
+        """
+        Find the branches that already match their upstream on the remote.
+
+        Lets callers skip fetching and updating branches that have not moved.
+
+        Args:
+            branches: Names of the local branches
+
+        Returns:
+            Branches whose local ref points to the same commit as their remote upstream
+        """
+        remote = self.remote_shas(branches)
+        return {
+            branch for branch, sha in remote.items()
+            if self.local_sha(branch) == sha
+        }
+
+    def merge_upstream(self) -> bool:
+        """
+        Fast-forward the checked-out branch to its already-fetched upstream.
 
-    def update_branch(self, branch: str) -> UpdateResult:
+        This does not contact the remote, so it should follow fetch_all().
+
+        Returns:
+            True if the merge succeeded, False otherwise
         """
-        Update a specific branch by checking out and pulling.
+        try:
+            self._run_git("merge", "--ff-only", "@{upstream}", capture="err_only")
+            return True
+        except GitError as e:
+            Logger.error(f"Merge failed: {e}")
+            return False
 
-        This is a convenience method that combines checkout and pull
-        with appropriate error handling and result reporting.
+    def update_branch_fast_forward(self, branch: str) -> UpdateResult:
+        """
+        Fast-forward a branch to its already-fetched upstream without fetching again.
+
+        Call after fetch_all(). A branch that is not checked out has its local
+        ref advanced in place, without touching the worktree. The checked-out
+        branch, or one that does not exist locally yet (checked out first so
+        git creates it from the fetched remote branch), is updated with
+        ``merge --ff-only``. Non-fast-forward updates are refused in both cases.
 
         Args:
             branch: Name of the branch to update
@@ -201,16 +439,30 @@ class GitRepo:
         Returns:
             UpdateResult with success status and message
         """
-        # Try to checkout the branch
-        if not self.checkout(branch):
-            return UpdateResult.failure_result(
-                self.path, branch, f"Failed to checkout branch '{branch}'"
-            )
-
-        # Try to pull
-        if not self.pull():
+        if branch != self.current_branch:
+            upstream = self.get_upstream(branch)
+            if upstream is not None:
+                try:
+                    self._run_git(
+                        "fetch", ".", f"{upstream}:refs/heads/{branch}", capture="err_only"
+                    )
+                except GitError as e:
+                    Logger.error(f"Fast-forward failed for branch '{branch}': {e}")
+                    return UpdateResult.failure_result(
+                        self.path, branch, f"Failed to fast-forward branch '{branch}'"
+                    )
+                return UpdateResult.success_result(
+                    self.path, branch, f"Successfully updated '{branch}'"
+                )
+
+            if not self.checkout(branch):
+                return UpdateResult.failure_result(
+                    self.path, branch, f"Failed to checkout branch '{branch}'"
+                )
+
+        if not self.merge_upstream():
             return UpdateResult.failure_result(
-                self.path, branch, f"Failed to pull branch '{branch}'"
+                self.path, branch, f"Failed to fast-forward branch '{branch}'"
             )
 
         return UpdateResult.success_result(
@@ -7,21 +7,39 @@ Windows Terminal/PowerShell.
 """
 
 import sys
-from enum import Enum
+import threading
 from typing import TextIO
 
 
-class Color(Enum):
-    """ANSI color codes for terminal output."""
-    RESET = "\033[0m"
-    RED = "\033[91m"
-    GREEN = "\033[92m"
-    YELLOW = "\033[93m"
-    BLUE = "\033[94m"
-    MAGENTA = "\033[95m"
-    CYAN = "\033[96m"
-    WHITE = "\033[97m"
-    BOLD = "\033[1m"
+# ANSI color codes for terminal output
+RESET = "\033[0m"
+RED = "\033[91m"
+GREEN = "\033[92m"
+YELLOW = "\033[93m"
+BLUE = "\033[94m"
+MAGENTA = "\033[95m"
+CYAN = "\033[96m"
+WHITE = "\033[97m"
+GRAY = "\033[90m"
+BOLD = "\033[1m"
+
+
+# (color, symbol) for each message kind
+_STYLES: dict[str, tuple[str, str]] = {
+    "success": (GREEN, "✓"),
+    "error": (RED, "✗"),
+    "info": (BLUE, "→"),
+    "warning": (YELLOW, "⚠"),
+}
+
+# Prefixes are built once at import rather than on every log call
+_COLOR_PREFIXES: dict[str, str] = {
+    kind: f"{color}{BOLD}{symbol}{RESET} "
+    for kind, (color, symbol) in _STYLES.items()
+}
+_PLAIN_PREFIXES: dict[str, str] = {
+    kind: f"{symbol} " for kind, (_, symbol) in _STYLES.items()
+}
 
 
 class Logger:
@@ -29,7 +47,7 @@ class Logger:
     Provides colored console output for user feedback.
 
     All methods are static for convenience. Colors can be disabled
-    by setting the class variable `use_colors = False`.
+    with `Logger.set_colors(False)`.
 
     Example:
         Logger.success("Repository updated!")
@@ -42,58 +60,116 @@ class Logger:
     output: TextIO = sys.stdout
     error_output: TextIO = sys.stderr
 
+    _local = threading.local()
+    _write_lock = threading.Lock()
+
     @classmethod
-    def _format(cls, color: Color, prefix: str, msg: str) -> str:
-        """Format a message with color and prefix."""
-        if cls.use_colors:
-            return f"{color.value}{Color.BOLD.value}{prefix}{Color.RESET.value} {msg}"
-        return f"{prefix} {msg}"
+    def _write(cls, text: str, stream: TextIO) -> None:
+        """Write a line to the stream, or to this thread's buffer if one is active."""
+        buffer = getattr(cls._local, "buffer", None)
+        if buffer is not None:
+            buffer.append((stream, text + "\n"))
+        else:
+            # Locked so it cannot land in the middle of another thread's flush
+            with cls._write_lock:
+                stream.write(text + "\n")
+
+    @classmethod
+    def begin_buffer(cls) -> None:
+        """Start collecting this thread's output instead of printing it."""
+        cls._local.buffer = []
+
+    @classmethod
+    def flush_buffer(cls) -> None:
+        """
+        Write out and stop this thread's buffered output.
+
+        Consecutive lines for the same stream are joined into a single write,
+        and the whole buffer is written under a lock so output from parallel
+        threads never interleaves.
+        """
+        buffer = getattr(cls._local, "buffer", None)
+        cls._local.buffer = None
+        if not buffer:
+            return
+
+        # Merge runs of lines bound for the same stream
+        runs: list[tuple[TextIO, list[str]]] = []
+        for stream, text in buffer:
+            if runs and runs[-1][0] is stream:
+                runs[-1][1].append(text)
+            else:
+                runs.append((stream, [text]))
+
+        with cls._write_lock:
+            for stream, texts in runs:
+                stream.write("".join(texts))
+                stream.flush()
+
+    @staticmethod
+    def _format_colored(kind: str, msg: str) -> str:
+        """Format a message with the colored prefix for its kind."""
+        return _COLOR_PREFIXES[kind] + msg
+
+    @staticmethod
+    def _format_plain(kind: str, msg: str) -> str:
+        """Format a message with the plain prefix for its kind."""
+        return _PLAIN_PREFIXES[kind] + msg
+
+    # Swapped by set_colors() so log calls do not re-check use_colors
+    _format = _format_colored
+
+    @classmethod
+    def set_colors(cls, enabled: bool) -> None:
+        """Enable or disable colored output."""
+        cls.use_colors = enabled
+        cls._format = staticmethod(cls._format_colored if enabled else cls._format_plain)
 
     @classmethod
     def success(cls, msg: str) -> None:
         """Print success message in green with checkmark."""
-        formatted = cls._format(Color.GREEN, "✓", msg)
-        print(formatted, file=cls.output)
+        formatted = cls._format("success", msg)
+        cls._write(formatted, cls.output)
 
     @classmethod
     def error(cls, msg: str) -> None:
         """Print error message in red with X mark."""
-        formatted = cls._format(Color.RED, "✗", msg)
-        print(formatted, file=cls.error_output)
+        formatted = cls._format("error", msg)
+        cls._write(formatted, cls.error_output)
 
     @classmethod
     def info(cls, msg: str) -> None:
         """Print info message in blue with arrow."""
-        formatted = cls._format(Color.BLUE, "→", msg)
-        print(formatted, file=cls.output)
+        formatted = cls._format("info", msg)
+        cls._write(formatted, cls.output)
 
     @classmethod
     def warning(cls, msg: str) -> None:
         """Print warning message in yellow with warning sign."""
-        formatted = cls._format(Color.YELLOW, "⚠", msg)
-        print(formatted, file=cls.output)
+        formatted = cls._format("warning", msg)
+        cls._write(formatted, cls.output)
 
     @classmethod
     def header(cls, msg: str) -> None:
         """Print a header/section title in cyan."""
         if cls.use_colors:
-            formatted = f"\n{Color.CYAN.value}{Color.BOLD.value}{'─' * 50}{Color.RESET.value}"
-            formatted += f"\n{Color.CYAN.value}{Color.BOLD.value}{msg}{Color.RESET.value}"
-            formatted += f"\n{Color.CYAN.value}{Color.BOLD.value}{'─' * 50}{Color.RESET.value}"
+            formatted = f"\n{CYAN}{BOLD}{'─' * 50}{RESET}"
+            formatted += f"\n{CYAN}{BOLD}{msg}{RESET}"
+            formatted += f"\n{CYAN}{BOLD}{'─' * 50}{RESET}"
         else:
             formatted = f"\n{'─' * 50}\n{msg}\n{'─' * 50}"
-        print(formatted, file=cls.output)
+        cls._write(formatted, cls.output)
 
     @classmethod
     def dim(cls, msg: str) -> None:
         """Print a dimmed/secondary message."""
         if cls.use_colors:
-            formatted = f"\033[90m{msg}{Color.RESET.value}"
+            formatted = f"{GRAY}{msg}{RESET}"
         else:
             formatted = msg
-        print(formatted, file=cls.output)
+        cls._write(formatted, cls.output)
 
     @classmethod
     def newline(cls) -> None:
         """Print an empty line."""
-        print(file=cls.output)
+        cls._write("", cls.output)
@@ -6,10 +6,15 @@ This module contains dataclasses that represent:
 - UpdateResult: Result of updating a single branch
 """
 
+import os
+import stat
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Self
 
+# Values of the 'enabled' column that mean the repository should be processed
+_TRUE_VALUES: frozenset[str] = frozenset({"true", "yes", "1", ""})
+
 
 @dataclass
 class Repository:
@@ -26,12 +31,15 @@ class Repository:
     enabled: bool = True
 
     @classmethod
-    def from_csv_row(cls, row: dict[str, str]) -> Self:
+    def from_row(cls, row: list[str], idx_path: int, idx_branches: int, idx_enabled: int = -1) -> Self:
         """
-        Create a Repository from a CSV row dictionary.
+        Create a Repository from a positional CSV row.
 
         Args:
-            row: Dictionary with 'path', 'branches', and optionally 'enabled' keys
+            row: Row fields as returned by csv.reader
+            idx_path: Index of the 'path' column
+            idx_branches: Index of the 'branches' column
+            idx_enabled: Index of the 'enabled' column, or -1 if there is none
 
         Returns:
             Repository instance
@@ -39,36 +47,58 @@ class Repository:
         Raises:
             ValueError: If required fields are missing or invalid
         """
-        if "path" not in row:
+        path_str = row[idx_path].strip() if idx_path < len(row) else ""
+        if not path_str:
             raise ValueError("CSV row missing required 'path' field")
-
-        path = Path(row["path"].strip())
+        path = Path(path_str)
 
         # Parse branches (comma-separated)
-        branches_str = row.get("branches", "").strip()
-        branches = [b.strip() for b in branches_str.split(",") if b.strip()]
+        branches_str = row[idx_branches].strip() if idx_branches < len(row) else ""
+        branches = [b for b in (part.strip() for part in branches_str.split(",")) if b]
 
         # Parse enabled flag (defaults to True)
-        enabled_str = row.get("enabled", "true").strip().lower()
-        enabled = enabled_str in ("true", "yes", "1", "")
+        enabled = (
+            row[idx_enabled].strip().lower() in _TRUE_VALUES
+            if 0 <= idx_enabled < len(row)
+            else True
+        )
 
         return cls(path=path, branches=branches, enabled=enabled)
 
-    def validate(self) -> list[str]:
+    def validate(self, entry: os.DirEntry | None = None) -> list[str]:
         """
         Validate the repository configuration.
 
+        Uses one stat of the path (checking its mode bits) and one of `.git`,
+        rather than separate exists()/is_dir() calls.
+
+        Args:
+            entry: Directory entry for the path from an earlier scandir of its
+                parent; if given, the path itself is not stat'ed again
+
         Returns:
             List of validation error messages (empty if valid)
         """
         errors = []
 
-        if not self.path.exists():
+        # Symlinks are stat'ed so a dangling link is reported as missing
+        if entry is not None and not entry.is_symlink():
+            is_dir: bool | None = entry.is_dir()
+        else:
+            try:
+                is_dir = stat.S_ISDIR(os.stat(self.path).st_mode)
+            except OSError:
+                is_dir = None
+
+        if is_dir is None:
             errors.append(f"Repository path does not exist: {self.path}")
-        elif not self.path.is_dir():
+        elif not is_dir:
             errors.append(f"Repository path is not a directory: {self.path}")
-        elif not (self.path / ".git").exists():
-            errors.append(f"Path is not a git repository: {self.path}")
+        else:
+            try:
+                os.stat(self.path / ".git")
+            except OSError:
+                errors.append(f"Path is not a git repository: {self.path}")
 
         if not self.branches:
             errors.append(f"No branches specified for repository: {self.path}")